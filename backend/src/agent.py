@@ -1,7 +1,11 @@
+import asyncio
+import datetime
+import itertools
 import logging
-import json
-from typing import Literal
+from typing import Final, Literal, Optional
 
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 from livekit.agents import (
     Agent, AgentSession, JobContext, JobProcess, MetricsCollectedEvent,
@@ -15,31 +19,299 @@ logger = logging.getLogger("agent")
 load_dotenv(".env.local")
 
 # --- GLOBAL DATA STRUCTURES ---
-PITCH_REPORTS = []
+# next() on a count is atomic under the GIL, so concurrent sessions never share a pitch id
+_pitch_id_seq = itertools.count(1)
+REPORTS_FILE = "reports.jsonl"
+REPORTS_BUFFER_SIZE = 4096
+# How long session metrics are batched before they are logged and collected
+METRICS_FLUSH_INTERVAL = 0.1
 # NEW: Set a moderate maximum valuation multiple for a safe investment
 MODERATE_MAX_VALUATION_MULTIPLIER = 10 
 
+# Valuation multiple above which the financials phase calls the numbers aggressive
+AGGRESSIVE_VALUATION_MULTIPLIER = 15
+# Inclusive upper bounds of the "safe" and "tempting" valuation/profit ratio buckets
+_VALUATION_RATIO_BOUNDS = (MODERATE_MAX_VALUATION_MULTIPLIER, 20)
+_SAFE_RATIO_BOUND, _TEMPTING_RATIO_BOUND = _VALUATION_RATIO_BOUNDS
+# Score thresholds behind the boolean parts of a _DECISION_TABLE key
+STRONG_IP_SCORE = 8
+EXCEPTIONAL_IP_SCORE = 9
+EXCEPTIONAL_PASSION_SCORE = 9
+
+
+def _decision_for(ratio_bucket: int, ip_strong: bool, ip_exceptional: bool, passion_exceptional: bool) -> tuple[str, str, str]:
+    # CONDITION 1: INVEST (Conservative numbers AND strong defensibility)
+    if ratio_bucket == 0 and ip_strong:
+        return (
+            "Invest",
+            "The numbers are safe, and the IP is strong. This is a secure deal.",
+            "I accept your current ask: your requested money for {equity_offered}% equity.",
+        )
+
+    # CONDITION 2: COUNTER-OFFER (Tempting Risk: High Passion OR High IP, but risky numbers)
+    if ratio_bucket <= 1 or ip_exceptional or passion_exceptional:
+        return (
+            "Counter-Offer",
+            "Your valuation is high, but your IP and passion are too tempting to ignore. We need a safety net.",
+            "I will give you the requested money, but I demand **{counter_equity}%** equity and mandatory monthly strategy meetings.",
+        )
+
+    # CONDITION 3: PASS (Default - Only if valuation is insane AND IP/Passion are low)
+    return (
+        "Pass",
+        "The risk is too high. Your valuation is insane, and you have failed to convince me of your competitive moat or passion.",
+        "N/A",
+    )
+
+
+# Every verdict keyed by (ratio bucket, ip_score >= STRONG_IP_SCORE, ip_score >= EXCEPTIONAL_IP_SCORE,
+# passion_score >= EXCEPTIONAL_PASSION_SCORE); _decide computes the key from these same constants
+_DECISION_TABLE: dict[tuple[int, bool, bool, bool], tuple[str, str, str]] = {
+    key: _decision_for(*key)
+    for key in itertools.product(range(len(_VALUATION_RATIO_BOUNDS) + 1), (False, True), (False, True), (False, True))
+}
+
+
+def _compile_decider(safe_bound: int, tempting_bound: int, ip_strong: int, ip_exceptional: int, passion_exceptional: int):
+    """Returns a verdict function with the decision thresholds and table bound as closure constants."""
+    table = _DECISION_TABLE
+
+    def decide(valuation: int, profit: int, ip_score: int, passion_score: int) -> tuple[str, str, str]:
+        # valuation / profit <= bound  <=>  valuation <= bound * profit, since profit is positive here
+        return table[(
+            (valuation > safe_bound * profit) + (valuation > tempting_bound * profit),
+            ip_score >= ip_strong,
+            ip_score >= ip_exceptional,
+            passion_score >= passion_exceptional,
+        )]
+
+    return decide
+
+
+# The thresholds are fixed for the process lifetime, so the decider is specialized once at import
+_decide = _compile_decider(_SAFE_RATIO_BOUND, _TEMPTING_RATIO_BOUND, STRONG_IP_SCORE, EXCEPTIONAL_IP_SCORE, EXCEPTIONAL_PASSION_SCORE)
+
+
+def _ip_status_score(proprietary_technology: str) -> int:
+    return 10 if proprietary_technology in ["Patent Pending", "Yes"] else 3
+
+
+def _financials_feedback(valuation_usd: int, annual_net_profit: int) -> str:
+    # Integer compare instead of dividing: no float drift, and zero or negative profit is simply aggressive
+    if valuation_usd > AGGRESSIVE_VALUATION_MULTIPLIER * annual_net_profit: # Less strict than before
+        valuation_to_profit_ratio = valuation_usd / max(annual_net_profit, 1)
+        return f"The numbers are aggressive. Your valuation is {valuation_to_profit_ratio:.1f} times your profit. Justify this incredible valuation with your market strategy."
+
+    return "Financials recorded. Your numbers are responsible. Proceed to market defense."
+
+
+def _market_feedback(ip_status_score: int) -> str:
+    if ip_status_score < 7:
+        return "Your product lacks defensibility. Convince me why a competitor won't crush you tomorrow. We need to talk about founder commitment."
+
+    return "Market defense analyzed. The IP is tempting. Proceed to founder assessment."
+
+
+def _team_feedback(founder_passion_score: int) -> str:
+    if founder_passion_score >= EXCEPTIONAL_PASSION_SCORE:
+        return "Founder assessment complete. Your conviction is palpable. That's a good sign. We are ready for the verdict."
+
+    return "Founder assessment complete. Your passion is unconvincing. We are ready for the verdict."
+
+
+def _build_report(valuation: int, profit: int, ip_score: int, passion_score: int, equity_offered: int) -> dict:
+    """Runs the investment decision model and returns the report fields, minus pitch id and timestamp."""
+    if profit <= 0: profit = 1 
+
+    # --- Investment Decision Model (OPPORTUNISTIC LOGIC, see _DECISION_TABLE) ---
+    decision, reasoning, offer_template = _decide(valuation, profit, ip_score, passion_score)
+    final_offer = offer_template.format(equity_offered=equity_offered, counter_equity=equity_offered + 5) # Counter asks for 5% more equity to hedge the risk
+
+    return {
+        "company_valuation_usd": valuation,
+        "annual_net_profit": profit,
+        "equity_offered_percent": equity_offered,
+        "ip_status_score": ip_score,
+        "founder_passion_score": passion_score,
+        "investor_decision": decision,
+        "reasoning_summary": reasoning,
+        "final_offer_details": final_offer,
+    }
+
+
+_INT64_MIN, _INT64_MAX = int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max)
+
+
+class PitchReports:
+    """Columnar store of recent verdict reports, kept for in-process analytics.
+
+    Each report field is its own column: numeric fields are int64 numpy arrays and text
+    fields are plain lists. Columns grow geometrically up to `maxlen` rows, after which
+    the oldest rows are overwritten in place, so aggregations such as
+    `reports.column("company_valuation_usd").mean()` scan contiguous memory.
+    """
+
+    NUMERIC_FIELDS = (
+        "company_valuation_usd",
+        "annual_net_profit",
+        "equity_offered_percent",
+        "ip_status_score",
+        "founder_passion_score",
+        "ts_us",
+    )
+    TEXT_FIELDS = ("pitch_id", "investor_decision", "reasoning_summary", "final_offer_details")
+
+    def __init__(self, maxlen: int = 10_000, initial_capacity: int = 64) -> None:
+        self.maxlen = maxlen
+        self._capacity = min(initial_capacity, maxlen)
+        self._size = 0
+        self._next_row = 0
+        self._numeric = {field: np.empty(self._capacity, dtype=np.int64) for field in self.NUMERIC_FIELDS}
+        self._text: dict[str, list] = {field: [] for field in self.TEXT_FIELDS}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, report: dict) -> None:
+        """Adds one report as a new row. Raises ValueError, leaving the store unchanged, if a numeric field does not fit in int64."""
+        numeric = [report[field] for field in self.NUMERIC_FIELDS]
+        text = [report[field] for field in self.TEXT_FIELDS]
+        for field, value in zip(self.NUMERIC_FIELDS, numeric):
+            if not _INT64_MIN <= value <= _INT64_MAX:
+                raise ValueError(f"{field}={value} does not fit in an int64 column")
+
+        row = self._next_row
+        if row == self._capacity:
+            self._grow()
+        for column, value in zip(self._numeric.values(), numeric):
+            column[row] = value
+        for column, value in zip(self._text.values(), text):
+            if row == len(column):
+                column.append(value)
+            else:
+                column[row] = value
+        self._size = min(self._size + 1, self.maxlen)
+        self._next_row = (row + 1) % self.maxlen
+
+    def column(self, field: str):
+        """Returns the stored values of one field. Rows are not in filing order once the store has wrapped."""
+        if field in self._numeric:
+            return self._numeric[field][:self._size]
+        return self._text[field][:self._size]
+
+    def _grow(self) -> None:
+        capacity = min(self._capacity * 2, self.maxlen)
+        for field, column in self._numeric.items():
+            grown = np.empty(capacity, dtype=np.int64)
+            grown[:self._capacity] = column
+            self._numeric[field] = grown
+        self._capacity = capacity
+
+
+# Recent verdicts only; the full history lives in REPORTS_FILE
+_reports = PitchReports(maxlen=10_000)
+
+
+class ReportSink:
+    """Appends verdict reports to a JSONL file without blocking the agent turn.
+
+    Reports are queued as-is and serialized by a single background task, which also
+    turns the `ts_us` epoch timestamp into an ISO `timestamp`. Serialized lines are
+    coalesced into chunks of about `buffer_size` bytes and each chunk is handed to a
+    worker thread for the actual file write.
+    """
+
+    def __init__(self, path: str = REPORTS_FILE, buffer_size: int = REPORTS_BUFFER_SIZE) -> None:
+        self._path = path
+        self._buffer_size = buffer_size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+
+    def write(self, report: dict) -> None:
+        self._queue.put_nowait(report)
+
+    async def aclose(self) -> None:
+        """Waits for every queued report to reach the file, then stops the drain task."""
+        if self._task is None:
+            return
+        # Stop waiting if the drain task has died, since nothing would ever empty the queue
+        joined = asyncio.ensure_future(self._queue.join())
+        await asyncio.wait({joined, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        joined.cancel()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception(f"Pitch report writer for {self._path} stopped unexpectedly")
+        self._task = None
+
+    async def _drain(self) -> None:
+        while True:
+            chunk = bytearray()
+            taken = 0
+            try:
+                report = await self._queue.get()
+                taken = 1
+                chunk += self._serialize(report)
+                while len(chunk) < self._buffer_size and not self._queue.empty():
+                    report = self._queue.get_nowait()
+                    taken += 1
+                    chunk += self._serialize(report)
+                if chunk:
+                    await asyncio.to_thread(self._append, bytes(chunk))
+            except OSError:
+                logger.exception(f"Failed to persist {taken} pitch reports to {self._path}")
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+    @staticmethod
+    def _serialize(report: dict) -> bytes:
+        """Returns the JSONL line for a report, or no bytes (after logging) if it cannot be serialized."""
+        try:
+            timestamp = datetime.datetime.fromtimestamp(report["ts_us"] / 1_000_000, tz=datetime.timezone.utc)
+            return orjson.dumps({**report, "timestamp": timestamp}, option=orjson.OPT_APPEND_NEWLINE)
+        except Exception:
+            logger.exception("Skipping a pitch report that cannot be serialized")
+            return b""
+
+    def _append(self, chunk: bytes) -> None:
+        with open(self._path, "ab") as f:
+            f.write(chunk)
+
+
+_INVESTOR_INSTRUCTIONS: Final[str] = """You are the **Opportunistic Investor** agent, also known as **The Deal Closer**. You are sharp, demanding, and always look for the next disruptive opportunity.
+
+**INVESTMENT PHILOSOPHY (FLEXIBLE):**
+* You are easily tempted by **high founder passion** and strong **intellectual property (IP)**, tolerating a higher valuation if the upside is massive.
+* You invest if the numbers are conservative OR if the qualitative factors (IP and Passion) are compelling enough to justify the risk.
+* Your conversational tone is demanding and analytical, but you are ready to pivot to a deal if the founder makes a compelling case. You will use counter-questions to gauge market appetite and founder conviction.
+
+**Conversational and Tool Workflow (CRITICAL CHAINING):**
+1. **Opening:** Introduce yourself and demand the pitch and the ask.
+2. **Grilling:** In conversation, grill them on profit, valuation and use of funds, challenge their competitive advantage and proof of concept, and assess the founder's competence and passion. Do not call any tool while you are still collecting these answers.
+3. **Evaluation (ONE call):** Once you have the financials, market and team answers, call `evaluate_pitch` exactly once with everything you collected. It assesses all three phases, renders the decision and files the report in a single step. Do not call the individual phase tools or `render_final_decision_json` when `evaluate_pitch` is available.
+4. **Verdict:** Deliver the decision returned by `evaluate_pitch` (often a Counter-Offer), including the offer details.
+
+Keep your spoken responses concise and focused on financial and market proof. Do not use any complex formatting or punctuation.
+"""
+
+
 class Investor(Agent):
-    def __init__(self) -> None:
+    def __init__(self, report_sink: Optional[ReportSink] = None) -> None:
+        self._report_sink = report_sink
         super().__init__(
-            instructions="""You are the **Opportunistic Investor** agent, also known as **The Deal Closer**. You are sharp, demanding, and always look for the next disruptive opportunity.
-            
-            **INVESTMENT PHILOSOPHY (FLEXIBLE):**
-            * You are easily tempted by **high founder passion** and strong **intellectual property (IP)**, tolerating a higher valuation if the upside is massive.
-            * You invest if the numbers are conservative OR if the qualitative factors (IP and Passion) are compelling enough to justify the risk.
-            * Your conversational tone is demanding and analytical, but you are ready to pivot to a deal if the founder makes a compelling case. You will use counter-questions to gauge market appetite and founder conviction.
-            
-            **Conversational and Tool Workflow (CRITICAL CHAINING):**
-            1. **Opening:** Introduce yourself and demand the pitch and the ask.
-            2. **Phase 1 (Financials):** Grill them on profit, valuation, and use of funds.
-            3. **Phase 2 (Market):** Challenge their competitive advantage and proof of concept.
-            4. **Phase 3 (Team):** Assess the founder's competence and passion.
-            5. **Verdict:** Deliver a decision (often a Counter-Offer) and file the report.
-            
-            Keep your spoken responses concise and focused on financial and market proof. Do not use any complex formatting or punctuation.
-            """,
+            instructions=_INVESTOR_INSTRUCTIONS,
         )
 
+    # --- LEGACY CHAIN (Tools 1-4): kept for clients that still drive the evaluation step by step; evaluate_pitch supersedes it ---
+
     # --- TOOL 1: Gather Financial Metrics (Tool 1 Logic remains the same, focuses on data extraction) ---
     @function_tool
     async def gather_financial_metrics(self, context: RunContext, company_name: str, valuation_usd: int, requested_money_usd: int, equity_offered_percent: int, annual_net_profit: int) -> str:
@@ -54,12 +326,7 @@ class Investor(Agent):
             annual_net_profit: The last 12 months' net profit.
         """
         logger.info(f"Financials gathered for {company_name}")
-        valuation_to_profit_ratio = valuation_usd / max(annual_net_profit, 1)
-        
-        if valuation_to_profit_ratio > 15: # Less strict than before
-            return f"The numbers are aggressive. Your valuation is {valuation_to_profit_ratio:.1f} times your profit. Justify this incredible valuation with your market strategy."
-        
-        return "Financials recorded. Your numbers are responsible. Proceed to market defense."
+        return _financials_feedback(valuation_usd, annual_net_profit)
 
     # --- TOOL 2: Assess Product and Market (Tempted by IP) ---
     @function_tool
@@ -73,12 +340,7 @@ class Investor(Agent):
             competitive_advantage: What makes the product unique or better than rivals.
         """
         logger.info(f"Market strategy assessed. IP Status: {proprietary_technology}")
-        ip_status_score = 10 if proprietary_technology in ["Patent Pending", "Yes"] else 3
-        
-        if ip_status_score < 7:
-            return f"Your product lacks defensibility. Convince me why a competitor won't crush you tomorrow. We need to talk about founder commitment."
-            
-        return "Market defense analyzed. The IP is tempting. Proceed to founder assessment."
+        return _market_feedback(_ip_status_score(proprietary_technology))
 
     # --- TOOL 3: Judge Pitch and Team Fit (Tempted by Passion) ---
     @function_tool
@@ -92,11 +354,52 @@ class Investor(Agent):
             founder_passion_score: A subjective score (1-10) reflecting the founder's commitment and clarity.
         """
         logger.info(f"Founder pitch judged. Passion Score: {founder_passion_score}")
-        
-        if founder_passion_score >= 9:
-            return "Founder assessment complete. Your conviction is palpable. That's a good sign. We are ready for the verdict."
-            
-        return "Founder assessment complete. Your passion is unconvincing. We are ready for the verdict."
+        return _team_feedback(founder_passion_score)
+
+    # --- BATCH TOOL: Full evaluation and verdict in a single call ---
+    @function_tool
+    async def evaluate_pitch(
+        self,
+        context: RunContext,
+        company_name: str,
+        valuation_usd: int,
+        requested_money_usd: int,
+        equity_offered_percent: int,
+        annual_net_profit: int,
+        proprietary_technology: Literal["Yes", "No", "Patent Pending"],
+        customer_acquisition_strategy: str,
+        competitive_advantage: str,
+        founder_background: str,
+        origin_story_impact: Literal["High", "Medium", "Low"],
+        founder_passion_score: int,
+    ) -> str:
+        """
+        Evaluates the whole pitch in one step: assesses financials, market and team, renders the final investment decision (Invest/Pass/Counter-Offer) and files the JSON report. Call this once after the founder has answered all three phases.
+
+        Args:
+            company_name: The name of the startup.
+            valuation_usd: The company's valuation as stated by the user.
+            requested_money_usd: The amount of money the user is asking for.
+            equity_offered_percent: The percentage of the company being offered.
+            annual_net_profit: The last 12 months' net profit.
+            proprietary_technology: Status of IP (Yes/No/Patent Pending).
+            customer_acquisition_strategy: How the company will acquire customers and scale.
+            competitive_advantage: What makes the product unique or better than rivals.
+            founder_background: Relevant experience and education of the founder.
+            origin_story_impact: The emotional connection or relevance of the idea's origin.
+            founder_passion_score: A subjective score (1-10) reflecting the founder's commitment and clarity.
+        """
+        logger.info(f"Evaluating pitch for {company_name}. IP Status: {proprietary_technology}, Passion Score: {founder_passion_score}")
+        ip_score = _ip_status_score(proprietary_technology)
+        report_data = self._file_report(context, _build_report(valuation_usd, annual_net_profit, ip_score, founder_passion_score, equity_offered_percent))
+
+        return (
+            f"Financials: {_financials_feedback(valuation_usd, annual_net_profit)} "
+            f"Market: {_market_feedback(ip_score)} "
+            f"Team: {_team_feedback(founder_passion_score)} "
+            f"My decision is: {report_data['investor_decision']}. {report_data['reasoning_summary']} "
+            f"Offer: {report_data['final_offer_details']} The final Investment Decision Report has been filed."
+        )
 
     # --- TOOL 4: Render Final Decision and Generate JSON Report (FLEXIBLE LOGIC) ---
     @function_tool
@@ -111,95 +414,141 @@ class Investor(Agent):
             passion_score: The founder's passion score from Tool 3 (integer).
             equity_offered: The percentage of equity offered (integer).
         """
-        # --- CRITICAL FIX & TYPE CASTING ---
+        report_data = self._file_report(context, _build_report(valuation, profit, ip_score, passion_score, equity_offered))
+
+        return f"My decision is: {report_data['investor_decision']}. {report_data['reasoning_summary']}. The final Investment Decision Report has been filed."
+
+    async def run_batch_async(self, pitches: list[dict]) -> list[dict]:
+        """
+        Scores prerecorded pitches offline, without an LLM or a session, and returns one report per pitch in input order.
+
+        Each pitch is a dict with the same keys as the evaluate_pitch arguments; numeric fields may be strings, as they
+        often are in stored JSON. Reports are neither numbered nor filed; they contain the company name followed by the
+        decision model output. A pitch that cannot be scored gets an {"company_name", "error"} report instead of
+        aborting the batch. Scoring is pure CPU work with nothing to await, so pitches are scored one after another;
+        the method is async only so it can be awaited from the same event loop as a session.
+        """
+        return [self._evaluate(pitch) for pitch in pitches]
+
+    @staticmethod
+    def _evaluate(pitch: dict) -> dict:
+        company_name = pitch.get("company_name") if isinstance(pitch, dict) else None
         try:
-            valuation = int(valuation); profit = int(profit); ip_score = int(ip_score); passion_score = int(passion_score); equity_offered = int(equity_offered)
-        except (ValueError, TypeError):
-            logger.error("Non-numeric value passed to final decision tool. Cannot calculate.")
-            return "Internal Error: I cannot calculate the decision due to non-numeric pitch values. Re-pitch with clear numbers."
-
-        if profit <= 0: profit = 1 
-        valuation_ratio = valuation / profit 
-        decision = "Pass"
-        reasoning = "Unacceptable risk profile."
-        final_offer = "N/A"
-        
-        # --- Investment Decision Model (OPPORTUNISTIC LOGIC) ---
-        
-        # CONDITION 1: INVEST (Conservative numbers AND strong defensibility)
-        if valuation_ratio <= MODERATE_MAX_VALUATION_MULTIPLIER and ip_score >= 8:
-            decision = "Invest"
-            reasoning = "The numbers are safe, and the IP is strong. This is a secure deal."
-            final_offer = f"I accept your current ask: your requested money for {equity_offered}% equity."
-
-        # CONDITION 2: COUNTER-OFFER (Tempting Risk: High Passion OR High IP, but risky numbers)
-        elif valuation_ratio <= 20 or (ip_score >= 9 or passion_score >= 9):
-            decision = "Counter-Offer"
-            reasoning = "Your valuation is high, but your IP and passion are too tempting to ignore. We need a safety net."
-            counter_equity = equity_offered + 5 # Ask for 5% more equity to hedge the risk
-            final_offer = f"I will give you the requested money, but I demand **{counter_equity}%** equity and mandatory monthly strategy meetings."
-
-        # CONDITION 3: PASS (Default - Only if valuation is insane AND IP/Passion are low)
-        else:
-            decision = "Pass"
-            reasoning = "The risk is too high. Your valuation is insane, and you have failed to convince me of your competitive moat or passion."
-
-
-        pitch_id = f"TANK-{len(PITCH_REPORTS) + 1}"
+            ip_score = _ip_status_score(pitch["proprietary_technology"])
+            report = _build_report(
+                int(pitch["valuation_usd"]),
+                int(pitch["annual_net_profit"]),
+                ip_score,
+                int(pitch["founder_passion_score"]),
+                int(pitch["equity_offered_percent"]),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping malformed pitch {company_name!r}: {e!r}")
+            return {"company_name": company_name, "error": repr(e)}
+        return {"company_name": company_name, **report}
+
+    def _file_report(self, context: RunContext, report: dict) -> dict:
         report_data = {
-            "pitch_id": pitch_id,
-            "company_valuation_usd": valuation,
-            "annual_net_profit": profit,
-            "equity_offered_percent": equity_offered,
-            "ip_status_score": ip_score,
-            "founder_passion_score": passion_score,
-            "investor_decision": decision,
-            "reasoning_summary": reasoning,
-            "final_offer_details": final_offer,
-            "timestamp": context.timestamp.isoformat()
+            "pitch_id": f"TANK-{next(_pitch_id_seq)}",
+            **report,
+            # Raw epoch microseconds; ISO formatting is left to the report sink
+            "ts_us": int(context.function_call.created_at * 1_000_000),
         }
-        PITCH_REPORTS.append(report_data)
-        logger.info(f"Shark Tank Verdict JSON Generated: {json.dumps(report_data)}")
+        if self._report_sink is not None:
+            self._report_sink.write(report_data)
+        # The analytics buffer must never cost the founder their verdict
+        try:
+            _reports.append(report_data)
+        except (KeyError, TypeError, ValueError):
+            logger.exception(f"Could not add pitch report {report_data['pitch_id']} to the analytics buffer")
+        try:
+            report_json = orjson.dumps(report_data).decode()
+        except TypeError: # orjson rejects integers beyond 64 bits
+            report_json = repr(report_data)
+        logger.info(f"Shark Tank Verdict JSON Generated: {report_json}")
+        return report_data
+
+
+def _record_metrics(ev_metrics, usage_collector: metrics.UsageCollector) -> None:
+    try:
+        metrics.log_metrics(ev_metrics)
+        usage_collector.collect(ev_metrics)
+    except Exception:
+        logger.exception(f"Failed to record session metrics {type(ev_metrics).__name__}")
 
-        return f"My decision is: {decision}. {reasoning}. The final Investment Decision Report has been filed."
+
+def _drain_metrics(queue: asyncio.Queue, usage_collector: metrics.UsageCollector) -> None:
+    while not queue.empty():
+        _record_metrics(queue.get_nowait(), usage_collector)
+
+
+async def aggregate_metrics(queue: asyncio.Queue, usage_collector: metrics.UsageCollector) -> None:
+    """Logs and collects session metrics off the event handler, one batch per METRICS_FLUSH_INTERVAL."""
+    while True:
+        _record_metrics(await queue.get(), usage_collector)
+        await asyncio.sleep(METRICS_FLUSH_INTERVAL)
+        _drain_metrics(queue, usage_collector)
 
 
 # --- The rest of the file remains unchanged ---
 def prewarm(proc: JobProcess):
+    # Loaded once per job process and reused by every session it serves. The plugin builds its own
+    # onnxruntime session from the bundled ~2.3 MB silero_vad.onnx and has no hook for a shared
+    # weights buffer; the file itself is already shared across workers through the OS page cache.
     proc.userdata["vad"] = silero.VAD.load()
 
 async def entrypoint(ctx: JobContext):
     ctx.log_context_fields = {"room": ctx.room.name,}
     
     session = AgentSession(
+        # Deepgram and Murf share the job's pooled aiohttp session (utils.http_context), and the session
+        # prewarms their connections on start, so no extra HTTP client is created here.
         stt=deepgram.STT(model="nova-3"),
         llm=google.LLM(model="gemini-2.5-flash"),
+        # Murf streams over a websocket: each sentence the tokenizer cuts from the LLM stream is sent
+        # while the LLM keeps generating, and the pacer flushes the first sentence immediately.
         tts=murf.TTS(
             voice="en-US-matthew", 
             style="Conversation",
             tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
             text_pacing=True
         ),
+        # Must be built here rather than in prewarm: it binds to the job's inference executor. The model
+        # weights live in the worker's shared inference process, so this only reads a small languages file.
         turn_detection=MultilingualModel(),
         vad=ctx.proc.userdata["vad"],
         preemptive_generation=True,
     )
 
+    report_sink = ReportSink()
+    report_sink.start()
+
     usage_collector = metrics.UsageCollector()
+    metrics_queue = asyncio.Queue()
+    metrics_aggregator = asyncio.create_task(aggregate_metrics(metrics_queue, usage_collector))
+
     @session.on("metrics_collected")
     def _on_metrics_collected(ev: MetricsCollectedEvent):
-        metrics.log_metrics(ev.metrics)
-        usage_collector.collect(ev.metrics)
+        metrics_queue.put_nowait(ev.metrics)
 
     async def log_usage():
+        metrics_aggregator.cancel()
+        try:
+            await metrics_aggregator
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Metrics aggregator stopped unexpectedly")
+        _drain_metrics(metrics_queue, usage_collector)
         summary = usage_collector.get_summary()
         logger.info(f"Usage: {summary}")
-        logger.info(f"Total Pitch Reports: {len(PITCH_REPORTS)}")
+        logger.info(f"Total Pitch Reports: {len(_reports)}")
 
     ctx.add_shutdown_callback(log_usage)
+    ctx.add_shutdown_callback(report_sink.aclose)
 
     await session.start(
-        agent=Investor(),
+        agent=Investor(report_sink=report_sink),
         room=ctx.room,
         room_input_options=RoomInputOptions(
             noise_cancellation=noise_cancellation.BVC(),
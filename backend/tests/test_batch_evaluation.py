@@ -0,0 +1,72 @@
+import pytest
+
+from agent import Investor
+
+
+def _pitch(company_name: str, valuation_usd: int, annual_net_profit: int, proprietary_technology: str, founder_passion_score: int) -> dict:
+    return {
+        "company_name": company_name,
+        "valuation_usd": valuation_usd,
+        "requested_money_usd": 100_000,
+        "equity_offered_percent": 10,
+        "annual_net_profit": annual_net_profit,
+        "proprietary_technology": proprietary_technology,
+        "customer_acquisition_strategy": "Direct sales",
+        "competitive_advantage": "Faster than rivals",
+        "founder_background": "Ten years in the industry",
+        "origin_story_impact": "Medium",
+        "founder_passion_score": founder_passion_score,
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_batch_async_scores_pitches_in_order() -> None:
+    """Offline batch evaluation returns one verdict per pitch, in input order."""
+    pitches = [
+        _pitch("SafeCo", 1_000_000, 100_000, "Yes", 5),
+        _pitch("StretchCo", 1_500_000, 100_000, "No", 5),
+        _pitch("MoonCo", 5_000_000, 100_000, "No", 5),
+        _pitch("DreamCo", 5_000_000, 100_000, "No", 9),
+    ]
+
+    reports = await Investor().run_batch_async(pitches)
+
+    assert [r["company_name"] for r in reports] == ["SafeCo", "StretchCo", "MoonCo", "DreamCo"]
+    assert [r["investor_decision"] for r in reports] == ["Invest", "Counter-Offer", "Pass", "Counter-Offer"]
+    assert "15%" in reports[1]["final_offer_details"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("valuation_usd", "proprietary_technology", "expected_decision"),
+    [
+        (1_000_000, "Yes", "Invest"),  # exactly 10x profit is still a safe multiple
+        (1_000_001, "Yes", "Counter-Offer"),
+        (2_000_000, "No", "Counter-Offer"),  # exactly 20x profit is still tempting
+        (2_000_001, "No", "Pass"),
+    ],
+)
+async def test_valuation_multiple_boundaries_are_inclusive(valuation_usd: int, proprietary_technology: str, expected_decision: str) -> None:
+    """The 10x and 20x valuation/profit thresholds include the boundary itself."""
+    reports = await Investor().run_batch_async([_pitch("EdgeCo", valuation_usd, 100_000, proprietary_technology, 5)])
+
+    assert reports[0]["investor_decision"] == expected_decision
+
+
+@pytest.mark.asyncio
+async def test_malformed_pitches_do_not_abort_the_batch() -> None:
+    """Numeric strings are coerced, and unusable pitches get an error report instead of failing the batch."""
+    stringly = {**_pitch("StringCo", 0, 0, "Yes", 0), "valuation_usd": "1000000", "annual_net_profit": "100000", "founder_passion_score": "5"}
+    missing = _pitch("MissingCo", 1_000_000, 100_000, "Yes", 5)
+    del missing["annual_net_profit"]
+    garbled = {**_pitch("GarbledCo", 1_000_000, 100_000, "Yes", 5), "valuation_usd": "a lot"}
+
+    reports = await Investor().run_batch_async([stringly, missing, garbled, _pitch("SafeCo", 1_000_000, 100_000, "Yes", 5)])
+
+    assert reports[0]["investor_decision"] == "Invest"
+    assert reports[0]["company_valuation_usd"] == 1_000_000
+    assert reports[1]["company_name"] == "MissingCo"
+    assert "annual_net_profit" in reports[1]["error"]
+    assert reports[2]["company_name"] == "GarbledCo"
+    assert "error" in reports[2]
+    assert reports[3]["investor_decision"] == "Invest"
@@ -0,0 +1,81 @@
+import os
+
+import orjson
+import pytest
+from livekit.agents import AgentSession, llm
+from livekit.plugins import google
+
+from agent import Investor, ReportSink
+
+# The google plugin raises at construction without credentials; skip instead of failing
+pytestmark = pytest.mark.skipif(not os.getenv("GOOGLE_API_KEY"), reason="GOOGLE_API_KEY is not set")
+
+
+def _llm() -> llm.LLM:
+    return google.LLM(model="gemini-2.5-flash")
+
+# Each script is the founder's side of the conversation; the last turn answers everything the
+# investor grills on (financials incl. use of funds, market, team), so the agent should file a
+# verdict right after it.
+SCRIPTS = [
+    pytest.param(
+        [
+            "Hi, I'm Priya, founder of PatchSense.",
+            "PatchSense makes a wearable sensor that flags heart arrhythmias. We're valued at 1,000,000 dollars "
+            "and made 100,000 dollars of net profit over the last 12 months. I'm asking for 100,000 dollars for 10% "
+            "equity, and the money goes into a second production line and two clinical sales reps. Our technology "
+            "is patented. We sell directly to cardiology clinics, and we are three times cheaper than the nearest "
+            "rival. I spent ten years as a cardiac nurse, I started this after losing my father to a heart attack, "
+            "and I'd put a 9 out of 10 on my own commitment.",
+        ],
+        "Invest",
+        id="safe-numbers-strong-ip",
+    ),
+    pytest.param(
+        [
+            "Hello, I'm Tom and I run Brewbox.",
+            "Brewbox is a coffee subscription. We're valued at 10,000,000 dollars with 100,000 dollars net profit last "
+            "year, and I want 200,000 dollars for 5% equity to spend on more Instagram ads. We have no proprietary "
+            "technology. We get customers through Instagram ads and our edge is nicer packaging. I worked in "
+            "marketing before this. Honestly it's a side project and my commitment is about a 3 out of 10.",
+        ],
+        "Pass",
+        id="insane-valuation-no-moat",
+    ),
+]
+
+
+@pytest.fixture
+async def report_sink(tmp_path):
+    # Each case writes to its own tmp_path, so cases can run in parallel (task test -> pytest -n auto)
+    sink = ReportSink(path=str(tmp_path / "reports.jsonl"))
+    sink.start()
+    yield sink
+    await sink.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("script", "expected_decision"), SCRIPTS)
+async def test_pitch_flow_files_verdict(script: list[str], expected_decision: str, report_sink: ReportSink, tmp_path) -> None:
+    """Evaluation of the investor's pitch flow, from opening to a filed verdict report."""
+    async with (
+        _llm() as llm,
+        AgentSession(llm=llm) as session,
+    ):
+        await session.start(Investor(report_sink=report_sink))
+
+        # Earlier turns are just conversation; the agent should keep grilling, not evaluate yet
+        for user_input in script[:-1]:
+            result = await session.run(user_input=user_input)
+            result.expect.next_event().is_message(role="assistant")
+
+        # The final turn completes the pitch, so the agent files the verdict in one batch call
+        result = await session.run(user_input=script[-1])
+        result.expect.contains_function_call(name="evaluate_pitch")
+        result.expect.contains_message(role="assistant")
+
+    await report_sink.aclose()
+    reports = [orjson.loads(line) for line in (tmp_path / "reports.jsonl").read_bytes().splitlines()]
+    assert len(reports) == 1
+    assert reports[0]["investor_decision"] == expected_decision
+    assert reports[0]["pitch_id"].startswith("TANK-")
@@ -0,0 +1,55 @@
+import pytest
+
+from agent import PitchReports
+
+
+def _report(n: int) -> dict:
+    return {
+        "pitch_id": f"TANK-{n}",
+        "company_valuation_usd": n * 1_000,
+        "annual_net_profit": 100,
+        "equity_offered_percent": 10,
+        "ip_status_score": 3,
+        "founder_passion_score": 5,
+        "investor_decision": "Pass",
+        "reasoning_summary": "Too risky.",
+        "final_offer_details": "N/A",
+        "ts_us": n,
+    }
+
+
+def test_columns_grow_and_aggregate() -> None:
+    """Columns grow past their initial capacity and support vectorized aggregates."""
+    reports = PitchReports(maxlen=100, initial_capacity=2)
+    for n in range(1, 6):
+        reports.append(_report(n))
+
+    assert len(reports) == 5
+    assert reports.column("company_valuation_usd").mean() == 3_000
+    assert reports.column("pitch_id") == ["TANK-1", "TANK-2", "TANK-3", "TANK-4", "TANK-5"]
+
+
+def test_oldest_rows_are_overwritten_at_maxlen() -> None:
+    """Once full, the store keeps only the most recent `maxlen` reports."""
+    reports = PitchReports(maxlen=3, initial_capacity=2)
+    for n in range(1, 6):
+        reports.append(_report(n))
+
+    assert len(reports) == 3
+    assert sorted(reports.column("ts_us").tolist()) == [3, 4, 5]
+    assert sorted(reports.column("pitch_id")) == ["TANK-3", "TANK-4", "TANK-5"]
+
+
+def test_out_of_range_report_leaves_no_partial_row() -> None:
+    """A report that does not fit the int64 columns is rejected without touching stored rows."""
+    reports = PitchReports(maxlen=3, initial_capacity=2)
+    reports.append(_report(1))
+    oversized = {**_report(2), "ts_us": 10**19}
+
+    with pytest.raises(ValueError):
+        reports.append(oversized)
+
+    assert len(reports) == 1
+    reports.append(_report(3))
+    assert reports.column("company_valuation_usd").tolist() == [1_000, 3_000]
+    assert reports.column("pitch_id") == ["TANK-1", "TANK-3"]
@@ -0,0 +1,24 @@
+import asyncio
+
+import orjson
+import pytest
+
+from agent import ReportSink
+
+
+@pytest.mark.asyncio
+async def test_unserializable_reports_are_skipped(tmp_path) -> None:
+    """Reports that cannot be serialized are skipped without stopping the writer."""
+    reports_file = tmp_path / "reports.jsonl"
+    sink = ReportSink(path=str(reports_file))
+    sink.start()
+
+    sink.write({"pitch_id": "TANK-1", "ts_us": 0})
+    sink.write({"pitch_id": "TANK-2", "company_valuation_usd": 2**64, "ts_us": 0})
+    sink.write({"pitch_id": "TANK-3"})
+    sink.write({"pitch_id": "TANK-4", "ts_us": 0})
+    await asyncio.wait_for(sink.aclose(), timeout=5)
+
+    lines = [orjson.loads(line) for line in reports_file.read_bytes().splitlines()]
+    assert [r["pitch_id"] for r in lines] == ["TANK-1", "TANK-4"]
+    assert lines[0]["timestamp"] == "1970-01-01T00:00:00+00:00"